@@ -291,17 +291,13 @@ def demo_full_workflow() -> None:
     catalog = DatasetCatalog()
     manager = DatasetVersionManager()
 
-    # Step 1: Validate
-    errors = validator.validate_schema(temp_path, schema)
+    # Steps 1+2: Validate, compute stats, and hash in a single file pass
+    errors, stats, file_hash = validator.validate_and_profile(temp_path, schema)
     if errors:
         print(f"  Validation failed: {errors}")
         Path(temp_path).unlink()
         return
     print("  Step 1: Validation passed.")
-
-    # Step 2: Compute stats and hash
-    stats = validator.compute_statistics(temp_path)
-    file_hash = compute_sha256(temp_path)
     print(f"  Step 2: Stats computed. Rows={stats['row_count']}, SHA256={file_hash[:16]}...")
 
     # Step 3: Register in catalog
@@ -6,6 +6,7 @@ from aumai_datacommons.core import (
     DatasetValidator,
     DatasetVersionManager,
     compute_sha256,
+    compute_sha256_many,
 )
 from aumai_datacommons.models import (
     DatasetFormat,
@@ -26,4 +27,5 @@ __all__ = [
     "DatasetVersionManager",
     "DownloadResult",
     "compute_sha256",
+    "compute_sha256_many",
 ]
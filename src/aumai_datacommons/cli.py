@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import click
@@ -14,7 +17,13 @@ from aumai_datacommons.core import (
     DatasetValidator,
     DatasetVersionManager,
 )
-from aumai_datacommons.models import DatasetFormat, DatasetMetadata
+from aumai_datacommons.models import (
+    DATASET_FORMAT_VALUES,
+    DatasetFormat,
+    DatasetMetadata,
+    loads,
+    parse_metadata_json,
+)
 
 # Module-level singletons used by CLI commands so they share state within a
 # single process invocation (e.g. during tests).
@@ -34,7 +43,7 @@ def main() -> None:
 @click.option(
     "--format",
     "dataset_format",
-    type=click.Choice([f.value for f in DatasetFormat]),
+    type=click.Choice(sorted(DATASET_FORMAT_VALUES)),
     default=None,
     help="Filter by dataset format.",
 )
@@ -72,43 +81,65 @@ def search_command(
         click.echo()
 
 
+def _parse_config(raw: bytes) -> DatasetMetadata:
+    """Parse and validate a JSON config into ``DatasetMetadata``.
+
+    JSON decoding and model validation run as a single pydantic-core
+    pass through the shared ``TypeAdapter``.
+
+    Raises:
+        ValueError: If the input is not a valid JSON object or fails
+            model validation.
+    """
+    try:
+        return parse_metadata_json(raw)
+    except Exception as exc:
+        raise ValueError(f"Invalid config: {exc}") from exc
+
+
 @main.command("register")
 @click.option(
     "--config",
     "config_path",
-    required=True,
+    default=None,
     type=click.Path(exists=True),
     help="Path to a JSON or YAML config file with DatasetMetadata fields.",
 )
-def register_command(config_path: str) -> None:
+@click.option(
+    "--config-dir",
+    "config_dir",
+    default=None,
+    type=click.Path(exists=True, file_okay=False),
+    help="Directory of JSON config files to register in one batch.",
+)
+def register_command(config_path: str | None, config_dir: str | None) -> None:
     """Register a dataset from a config file.
 
     The config file must be a JSON file whose keys match the
-    DatasetMetadata schema fields.
+    DatasetMetadata schema fields.  With --config-dir, every ``.json``
+    file in the directory is read and registered in one batch.
 
     Example: aumai-datacommons register --config dataset.json
     """
-    path = Path(config_path)
-    try:
-        raw_text = path.read_text(encoding="utf-8")
-    except OSError as exc:
-        click.echo(f"Error reading config: {exc}", err=True)
+    if (config_path is None) == (config_dir is None):
+        click.echo("Provide exactly one of --config or --config-dir.", err=True)
         sys.exit(1)
 
-    try:
-        data: object = json.loads(raw_text)
-    except json.JSONDecodeError as exc:
-        click.echo(f"Invalid JSON in config: {exc}", err=True)
-        sys.exit(1)
+    if config_dir is not None:
+        _register_batch(config_dir)
+        return
 
-    if not isinstance(data, dict):
-        click.echo("Config file must contain a JSON object.", err=True)
+    path = Path(config_path)  # type: ignore[arg-type]
+    try:
+        raw = path.read_bytes()
+    except OSError as exc:
+        click.echo(f"Error reading config: {exc}", err=True)
         sys.exit(1)
 
     try:
-        metadata = DatasetMetadata.model_validate(data)
-    except Exception as exc:
-        click.echo(f"Validation error: {exc}", err=True)
+        metadata = _parse_config(raw)
+    except ValueError as exc:
+        click.echo(str(exc), err=True)
         sys.exit(1)
 
     _catalog.register(metadata)
@@ -118,6 +149,80 @@ def register_command(config_path: str) -> None:
     )
 
 
+def _register_batch(config_dir: str) -> None:
+    """Register every JSON config file in a directory as one batch."""
+    config_paths = sorted(
+        entry.path
+        for entry in os.scandir(config_dir)
+        if entry.is_file() and entry.name.endswith(".json")
+    )
+    if not config_paths:
+        click.echo(f"No .json config files found in '{config_dir}'.", err=True)
+        sys.exit(1)
+
+    # Reading is I/O-bound, so fan the file reads out over threads.  Read
+    # failures (file removed since the scan, permissions) are returned per
+    # file and reported alongside parse errors instead of aborting the scan.
+    def read_file(file_path: str) -> bytes | OSError:
+        try:
+            return Path(file_path).read_bytes()
+        except OSError as exc:
+            return exc
+
+    with ThreadPoolExecutor() as executor:
+        raw_configs = list(executor.map(read_file, config_paths))
+
+    batch: list[DatasetMetadata] = []
+    errors: list[str] = []
+    for file_path, raw in zip(config_paths, raw_configs, strict=True):
+        if isinstance(raw, OSError):
+            errors.append(f"{Path(file_path).name}: {raw}")
+            continue
+        try:
+            batch.append(_parse_config(raw))
+        except ValueError as exc:
+            errors.append(f"{Path(file_path).name}: {exc}")
+
+    if errors:
+        click.echo(f"Batch registration failed with {len(errors)} error(s):", err=True)
+        for error in errors:
+            click.echo(f"  - {error}", err=True)
+        sys.exit(1)
+
+    _catalog.register_many(batch)
+    for metadata in batch:
+        _version_manager.create_version(metadata.dataset_id, "Initial registration.")
+    click.echo(f"Registered {len(batch)} dataset(s) from '{config_dir}'.")
+
+
+# Parsed schemas keyed by content digest, so repeated validate runs in one
+# process (and the compiled validators they seed in core) are reused rather
+# than rebuilt per invocation.
+_SCHEMA_CACHE: dict[bytes, dict[str, object]] = {}
+
+
+def _load_schema(raw: bytes) -> dict[str, object]:
+    """Parse schema bytes into a dict, cached by content digest.
+
+    Raises:
+        ValueError: If the bytes are not a JSON object.
+    """
+    key = hashlib.sha256(raw).digest()
+    cached = _SCHEMA_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    try:
+        schema_raw: object = loads(raw)
+    except ValueError as exc:
+        raise ValueError(f"Invalid schema JSON: {exc}") from exc
+    if not isinstance(schema_raw, dict):
+        raise ValueError("Schema must be a JSON object.")
+
+    _SCHEMA_CACHE[key] = schema_raw
+    return schema_raw
+
+
 @main.command("validate")
 @click.option(
     "--dataset",
@@ -138,18 +243,12 @@ def validate_command(dataset_path: str, schema_path: str) -> None:
 
     Example: aumai-datacommons validate --dataset data.jsonl --schema schema.json
     """
-    schema_text = Path(schema_path).read_text(encoding="utf-8")
     try:
-        schema_raw: object = json.loads(schema_text)
-    except json.JSONDecodeError as exc:
-        click.echo(f"Invalid schema JSON: {exc}", err=True)
-        sys.exit(1)
-
-    if not isinstance(schema_raw, dict):
-        click.echo("Schema must be a JSON object.", err=True)
+        schema = _load_schema(Path(schema_path).read_bytes())
+    except ValueError as exc:
+        click.echo(str(exc), err=True)
         sys.exit(1)
 
-    schema: dict[str, object] = schema_raw
     errors = _validator.validate_schema(dataset_path, schema)
 
     if errors:
@@ -5,9 +5,17 @@ from __future__ import annotations
 import csv
 import hashlib
 import json
+import mmap
+import os
+import pickle
+import time
+import warnings
 from collections import defaultdict
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any
 
 from aumai_datacommons.models import (
     DatasetFormat,
@@ -15,6 +23,55 @@ from aumai_datacommons.models import (
     DatasetVersion,
 )
 
+# Annotated explicitly so both the orjson and stdlib assignments satisfy
+# strict mypy despite their differing full signatures.
+_json_loads: Callable[[bytes | bytearray | str], Any]
+
+try:  # pragma: no cover - exercised only where orjson is installed
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:  # pragma: no cover - exercised only where pyarrow is installed
+    import pyarrow as pa  # type: ignore[import-not-found]
+    import pyarrow.csv as pacsv  # type: ignore[import-not-found]
+    import pyarrow.json as pajson  # type: ignore[import-not-found]
+except ImportError:
+    pa = None
+    pacsv = None
+    pajson = None
+
+
+# Buffer size for file hashing.  1 MiB keeps the per-call overhead of
+# ``update()`` negligible and lets OpenSSL's hardware-accelerated SHA-256
+# (SHA-NI / ARMv8 crypto extensions) run over thousands of blocks per call.
+_HASH_BUFFER_SIZE = 1 << 20
+
+# Files at least this large are hashed through mmap, avoiding the per-chunk
+# copy from page cache into a Python buffer.  Below it, mmap setup cost
+# outweighs the saved copies.
+_MMAP_HASH_THRESHOLD = 8 * 1024 * 1024
+
+
+def _utc_now() -> datetime:
+    """Current UTC time from a single clock read.
+
+    Cheaper than ``datetime.now(tz=...)`` in tight loops: one
+    ``time.time_ns()`` call plus a direct ``fromtimestamp`` conversion.
+    """
+    return datetime.fromtimestamp(time.time_ns() / 1e9, tz=timezone.utc)
+
+
+if hashlib.sha256().__class__.__module__ != "_hashlib":  # pragma: no cover
+    warnings.warn(
+        "hashlib.sha256 is not backed by OpenSSL on this interpreter build;"
+        " file hashing will not use hardware-accelerated SHA-256.",
+        RuntimeWarning,
+        stacklevel=2,
+    )
+
 
 class DatasetNotFoundError(KeyError):
     """Raised when a dataset_id is not present in the catalog."""
@@ -23,12 +80,29 @@ class DatasetNotFoundError(KeyError):
 class DatasetCatalog:
     """In-memory catalog of registered datasets.
 
-    Designed to be backed by a persistent store; the interface
-    intentionally avoids I/O so callers can wrap it with any storage layer.
+    Designed to be backed by a persistent store; the core interface
+    avoids I/O so callers can wrap it with any storage layer.
+    :meth:`save` and :meth:`load` provide a built-in snapshot format for
+    callers that just want durability across restarts.
     """
 
     def __init__(self) -> None:
-        self._store: dict[str, DatasetMetadata] = {}
+        # Struct-of-arrays layout: parallel columns indexed by an integer
+        # slot, so scans walk contiguous lists instead of chasing one
+        # Python object per entry.  Slots are assigned in registration
+        # order and never reused.
+        self._id_to_slot: dict[str, int] = {}
+        self._ids: list[str] = []
+        self._metadata: list[DatasetMetadata] = []
+        self._texts_lower: list[str] = []
+        self._tag_sets: list[frozenset[str]] = []
+        self._formats: list[DatasetFormat] = []
+        # Inverted indexes: posting lists of slots per tag, format and
+        # text token, so filters intersect small sets instead of scanning
+        # every entry.
+        self._by_tag: dict[str, set[int]] = defaultdict(set)
+        self._by_format: dict[DatasetFormat, set[int]] = defaultdict(set)
+        self._by_token: dict[str, set[int]] = defaultdict(set)
 
     def register(self, metadata: DatasetMetadata) -> None:
         """Register or overwrite a dataset entry.
@@ -36,7 +110,39 @@ class DatasetCatalog:
         Args:
             metadata: Complete metadata for the dataset.
         """
-        self._store[metadata.dataset_id] = metadata
+        dataset_id = metadata.dataset_id
+        text_lower = f"{metadata.name} {metadata.description}".lower()
+        tag_set = frozenset(metadata.tags)
+
+        slot = self._id_to_slot.get(dataset_id)
+        if slot is None:
+            slot = len(self._ids)
+            self._id_to_slot[dataset_id] = slot
+            self._ids.append(dataset_id)
+            self._metadata.append(metadata)
+            self._texts_lower.append(text_lower)
+            self._tag_sets.append(tag_set)
+            self._formats.append(metadata.format)
+        else:
+            self._unindex(slot)
+            self._metadata[slot] = metadata
+            self._texts_lower[slot] = text_lower
+            self._tag_sets[slot] = tag_set
+            self._formats[slot] = metadata.format
+
+        for tag in tag_set:
+            self._by_tag[tag].add(slot)
+        self._by_format[metadata.format].add(slot)
+        for token in set(text_lower.split()):
+            self._by_token[token].add(slot)
+
+    def _unindex(self, slot: int) -> None:
+        """Remove a slot's entries from all inverted indexes."""
+        for tag in self._tag_sets[slot]:
+            self._by_tag[tag].discard(slot)
+        self._by_format[self._formats[slot]].discard(slot)
+        for token in set(self._texts_lower[slot].split()):
+            self._by_token[token].discard(slot)
 
     def search(
         self,
@@ -48,6 +154,8 @@ class DatasetCatalog:
 
         Performs case-insensitive substring matching on ``name`` and
         ``description``. Additional filters narrow the result set.
+        Filters resolve through inverted indexes (tag, format and text
+        token posting lists), so only surviving candidates are inspected.
 
         Args:
             query: Substring to match against name and description.
@@ -55,25 +163,145 @@ class DatasetCatalog:
             tags: If given, datasets must carry *all* of these tags.
 
         Returns:
-            List of matching ``DatasetMetadata`` objects.
+            List of matching ``DatasetMetadata`` objects, in registration order.
         """
+        candidates: set[int] | None = None
+
+        if dataset_format is not None:
+            candidates = set(self._by_format.get(dataset_format, ()))
+            if not candidates:
+                return []
+        if tags:
+            postings: list[set[int]] = []
+            for tag in set(tags):
+                posting = self._by_tag.get(tag)
+                if not posting:
+                    return []
+                postings.append(posting)
+            # Intersect the smallest posting list first so the C-level set
+            # intersection touches as few elements as possible.
+            postings.sort(key=len)
+            tag_candidates = postings[0].intersection(*postings[1:])
+            if not tag_candidates:
+                return []
+            candidates = (
+                tag_candidates if candidates is None else candidates & tag_candidates
+            )
+            if not candidates:
+                return []
+
+        # With an empty query the text stage is a no-op: the result is
+        # exactly the filter intersection (or the whole catalog).
+        if not query:
+            if candidates is None:
+                return list(self._metadata)
+            return [self._metadata[slot] for slot in sorted(candidates)]
+
         query_lower = query.lower()
+        # A single-word query cannot span a whitespace boundary, so the
+        # token index answers it exactly: the query must be a substring of
+        # some token of the name or description.  For multi-word queries
+        # the same index is a prefilter — every word of a matching phrase
+        # lies within one text token — and the exact phrase check below
+        # runs only on the survivors.
+        single_token = bool(query_lower) and " " not in query_lower
+        for query_token in query_lower.split():
+            token_matches: set[int] = set()
+            for token, posting in self._by_token.items():
+                if query_token in token:
+                    token_matches |= posting
+            candidates = (
+                token_matches if candidates is None else candidates & token_matches
+            )
+            if not candidates:
+                return []
+
+        phrase_check = bool(query_lower) and not single_token
+        texts_lower = self._texts_lower
         results: list[DatasetMetadata] = []
-
-        for metadata in self._store.values():
-            text_match = query_lower in metadata.name.lower() or query_lower in metadata.description.lower()
-            if not text_match:
-                continue
-            if dataset_format is not None and metadata.format != dataset_format:
+        if candidates is None:
+            slots: Iterable[int] = range(len(self._ids))
+        else:
+            slots = sorted(candidates)
+        for slot in slots:
+            if phrase_check and query_lower not in texts_lower[slot]:
                 continue
-            if tags is not None:
-                metadata_tag_set = set(metadata.tags)
-                if not all(tag in metadata_tag_set for tag in tags):
-                    continue
-            results.append(metadata)
+            results.append(self._metadata[slot])
 
         return results
 
+    def register_many(self, items: Iterable[DatasetMetadata]) -> None:
+        """Register a batch of datasets in one pass.
+
+        Args:
+            items: Metadata objects to register, in order.
+        """
+        for metadata in items:
+            self.register(metadata)
+
+    def register_unchecked(self, rows: Iterable[dict[str, object]]) -> None:
+        """Bulk-register trusted records without re-running validation.
+
+        Each row is turned into a ``DatasetMetadata`` via
+        ``model_construct``, which skips all field validators.  Only use
+        this for data that has already passed validation — typically
+        ``model_dump()`` output read back from a trusted store; field
+        types are taken as-is.
+
+        Args:
+            rows: Field dictionaries with already-correct value types.
+        """
+        for row in rows:
+            # Positional None pins _fields_set so **row cannot bind it.
+            self.register(DatasetMetadata.model_construct(None, **row))
+
+    def save(self, path: str) -> None:
+        """Persist a snapshot of the catalog to a file, atomically.
+
+        The snapshot is written to a temporary sibling file and swapped
+        into place with ``os.replace``, so readers never observe a
+        partially written snapshot.
+
+        Args:
+            path: Destination file for the snapshot.
+        """
+        target = Path(path)
+        store = dict(zip(self._ids, self._metadata, strict=True))
+        payload = pickle.dumps(store, protocol=5)
+        temp_path = target.with_name(target.name + ".tmp")
+        temp_path.write_bytes(payload)
+        os.replace(temp_path, target)
+
+    @classmethod
+    def load(cls, path: str) -> DatasetCatalog:
+        """Load a catalog from a snapshot written by :meth:`save`.
+
+        The snapshot file is memory-mapped so deserialization reads
+        straight from the page cache.  Inverted indexes are rebuilt by
+        re-registering each entry rather than persisted.
+
+        Warning:
+            Snapshots are pickle data: loading one can execute arbitrary
+            code, so only load files written by :meth:`save` from a
+            source you trust.
+
+        Args:
+            path: Snapshot file to load.
+
+        Returns:
+            A new ``DatasetCatalog`` populated from the snapshot.
+        """
+        snapshot_path = Path(path)
+        with snapshot_path.open("rb") as snapshot_handle:
+            with mmap.mmap(
+                snapshot_handle.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mapped:
+                # Trusted-input only; see the docstring warning above.
+                store: dict[str, DatasetMetadata] = pickle.loads(mapped)  # noqa: S301
+        catalog = cls()
+        catalog.register_many(store.values())
+        return catalog
+
     def get(self, dataset_id: str) -> DatasetMetadata:
         """Retrieve a dataset by its ID.
 
@@ -87,7 +315,7 @@ class DatasetCatalog:
             DatasetNotFoundError: If no dataset with that ID exists.
         """
         try:
-            return self._store[dataset_id]
+            return self._metadata[self._id_to_slot[dataset_id]]
         except KeyError:
             raise DatasetNotFoundError(f"Dataset '{dataset_id}' not found.") from None
 
@@ -99,10 +327,111 @@ class DatasetCatalog:
             offset: Number of records to skip from the beginning.
 
         Returns:
-            Slice of all registered ``DatasetMetadata`` objects.
+            Slice of all registered ``DatasetMetadata`` objects, in
+            registration order.
         """
-        all_items = list(self._store.values())
-        return all_items[offset : offset + limit]
+        return self._metadata[offset : offset + limit]
+
+
+# Sentinel distinguishing "field absent" from any JSON value in generated
+# validators.
+_MISSING = object()
+
+# Type names accepted in field-type schemas, mapped to their Python types.
+_TYPE_MAP: dict[str, type[object]] = {
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": bool,
+    "list": list,
+    "dict": dict,
+}
+
+# Generated validator functions, keyed by the (field, type name) signature
+# of the schema they were specialized for.
+_VALIDATOR_CACHE: dict[
+    tuple[tuple[str, str], ...],
+    Callable[[dict[str, object], int, list[str]], None],
+] = {}
+
+
+def _validator_for(
+    schema: dict[str, object],
+) -> Callable[[dict[str, object], int, list[str]], None]:
+    """Return the compiled validator for a schema, compiling on first use."""
+    compiled = [
+        (field_name, _TYPE_MAP.get(expected_type_name), expected_type_name)
+        for field_name, expected_type_name in schema.items()
+        if isinstance(expected_type_name, str)
+    ]
+    cache_key = tuple(
+        (field_name, expected_type_name)
+        for field_name, _python_type, expected_type_name in compiled
+    )
+    validator = _VALIDATOR_CACHE.get(cache_key)
+    if validator is None:
+        validator = _compile_validator(compiled)
+        _VALIDATOR_CACHE[cache_key] = validator
+    return validator
+
+
+def _compile_validator(
+    compiled_schema: list[tuple[str, type[object] | None, str]],
+) -> Callable[[dict[str, object], int, list[str]], None]:
+    """Specialize a schema into a generated per-record validator.
+
+    Emits one membership check and one type check per schema field as
+    straight-line code, so the hot loop no longer iterates the schema for
+    every record.  Field names and type objects are bound through the
+    exec namespace rather than embedded as literals.
+    """
+    lines = ["def _validate(record, line_number, errors):"]
+    namespace: dict[str, object] = {"_MISSING": _MISSING}
+
+    if not compiled_schema:
+        lines.append("    pass")
+    for index, (field_name, python_type, type_name) in enumerate(compiled_schema):
+        field_ref = f"_field_{index}"
+        namespace[field_ref] = field_name
+        lines.append(f"    value = record.get({field_ref}, _MISSING)")
+        lines.append("    if value is _MISSING:")
+        lines.append(
+            '        errors.append(f"Line {line_number}:'
+            f" missing required field '{{{field_ref}}}'.\")"
+        )
+        if python_type is None:
+            continue
+        type_ref = f"_type_{index}"
+        name_ref = f"_name_{index}"
+        namespace[type_ref] = python_type
+        namespace[name_ref] = type_name
+        if python_type is bool:
+            check = f"not isinstance(value, {type_ref})"
+        else:
+            # bool subclasses int, so reject it for every other type.
+            check = f"isinstance(value, bool) or not isinstance(value, {type_ref})"
+        lines.append(f"    elif {check}:")
+        lines.append(
+            '        errors.append(f"Line {line_number}:'
+            f" field '{{{field_ref}}}' expected {{{name_ref}}},"
+            ' got {type(value).__name__}.")'
+        )
+
+    exec("\n".join(lines), namespace)  # noqa: S102
+    validator: Callable[[dict[str, object], int, list[str]], None] = namespace[
+        "_validate"
+    ]  # type: ignore[assignment]
+    return validator
+
+
+def _named_type_distribution(
+    type_dist: dict[str, dict[type[object], int]],
+) -> dict[str, dict[str, int]]:
+    """Convert per-field type-object tallies to type-name tallies."""
+    return {
+        field: {vtype.__name__: count for vtype, count in dist.items()}
+        for field, dist in type_dist.items()
+    }
 
 
 class DatasetValidator:
@@ -113,7 +442,8 @@ class DatasetValidator:
 
         The schema format is ``{"field_name": "type_name", ...}`` where
         type names are Python primitives: ``str``, ``int``, ``float``,
-        ``bool``, ``list``, ``dict``.
+        ``bool``, ``list``, ``dict``.  A ``bool`` value only satisfies
+        ``bool``, even though ``bool`` subclasses ``int`` in Python.
 
         Args:
             data_path: Filesystem path to a ``.jsonl`` file.
@@ -122,27 +452,23 @@ class DatasetValidator:
         Returns:
             List of validation error messages.  Empty means valid.
         """
-        type_map: dict[str, type[object]] = {
-            "str": str,
-            "int": int,
-            "float": float,
-            "bool": bool,
-            "list": list,
-            "dict": dict,
-        }
         errors: list[str] = []
         path = Path(data_path)
 
         if not path.exists():
             return [f"File not found: {data_path}"]
 
-        with path.open(encoding="utf-8") as file_handle:
+        validator = _validator_for(schema)
+
+        # Binary mode lets the JSON parser consume raw bytes directly,
+        # skipping a separate decode pass per line.
+        with path.open("rb") as file_handle:
             for line_number, raw_line in enumerate(file_handle, start=1):
                 raw_line = raw_line.strip()
                 if not raw_line:
                     continue
                 try:
-                    record: object = json.loads(raw_line)
+                    record: object = _json_loads(raw_line)
                 except json.JSONDecodeError as exc:
                     errors.append(f"Line {line_number}: JSON decode error — {exc}")
                     continue
@@ -152,29 +478,86 @@ class DatasetValidator:
                     continue
 
                 record_dict: dict[str, object] = record
-                for field_name, expected_type_name in schema.items():
-                    if not isinstance(expected_type_name, str):
-                        continue
-                    if field_name not in record_dict:
-                        errors.append(
-                            f"Line {line_number}: missing required field '{field_name}'."
-                        )
-                        continue
-                    python_type = type_map.get(expected_type_name)
-                    if python_type is None:
-                        continue
-                    value = record_dict[field_name]
-                    if not isinstance(value, python_type):
-                        errors.append(
-                            f"Line {line_number}: field '{field_name}' expected"
-                            f" {expected_type_name}, got {type(value).__name__}."
-                        )
+                validator(record_dict, line_number, errors)
 
         return errors
 
+    def validate_and_profile(
+        self, data_path: str, schema: dict[str, object]
+    ) -> tuple[list[str], dict[str, object], str]:
+        """Validate, profile and hash a JSONL file in one streaming pass.
+
+        Fuses :meth:`validate_schema`, :meth:`compute_statistics` and
+        :func:`compute_sha256` into a single traversal: each raw line
+        feeds the SHA-256 hasher, is parsed once, and updates both the
+        statistics counters and the schema validator.  Workflows that
+        need all three avoid reading (and re-parsing) the file three
+        times.
+
+        Args:
+            data_path: Filesystem path to a ``.jsonl`` file.
+            schema: Mapping from field name to expected type name string.
+
+        Returns:
+            Tuple of (validation errors, statistics dictionary, SHA-256
+            hex digest).  A missing file yields a single error, an
+            ``error`` statistics entry and an empty digest.
+        """
+        path = Path(data_path)
+        if not path.exists():
+            message = f"File not found: {data_path}"
+            return [message], {"error": message}, ""
+
+        validator = _validator_for(schema)
+        errors: list[str] = []
+        hasher = hashlib.sha256()
+        row_count = 0
+        null_counts: dict[str, int] = defaultdict(int)
+        type_dist: dict[str, dict[type[object], int]] = defaultdict(
+            lambda: defaultdict(int)
+        )
+
+        with path.open("rb") as file_handle:
+            for line_number, raw_line in enumerate(file_handle, start=1):
+                hasher.update(raw_line)
+                stripped = raw_line.strip()
+                if not stripped:
+                    continue
+                try:
+                    record: object = _json_loads(stripped)
+                except json.JSONDecodeError as exc:
+                    errors.append(f"Line {line_number}: JSON decode error — {exc}")
+                    continue
+
+                if not isinstance(record, dict):
+                    errors.append(f"Line {line_number}: record is not a JSON object.")
+                    continue
+
+                record_dict: dict[str, object] = record
+                row_count += 1
+                for field, value in record_dict.items():
+                    if value is None or value == "":
+                        null_counts[field] += 1
+                    type_dist[field][type(value)] += 1
+                validator(record_dict, line_number, errors)
+
+        stats: dict[str, object] = {
+            "row_count": row_count,
+            "null_counts": dict(null_counts),
+            "type_distribution": _named_type_distribution(type_dist),
+        }
+        return errors, stats, hasher.hexdigest()
+
     def compute_statistics(self, data_path: str) -> dict[str, object]:
         """Compute basic statistics for a JSONL or CSV file.
 
+        CSV and JSONL files are read with pyarrow's vectorized,
+        multithreaded parsers when pyarrow is installed; row counts and
+        per-column null counts then come from columnar Arrow metadata
+        instead of a per-row Python loop.  The ``csv.DictReader`` fallback
+        reports every value as ``str``, while the pyarrow path reports
+        inferred column types.
+
         Args:
             data_path: Filesystem path to the data file.
 
@@ -188,50 +571,111 @@ class DatasetValidator:
 
         suffix = path.suffix.lower()
 
-        rows: list[dict[str, object]] = []
+        if pa is not None:  # pragma: no cover
+            try:
+                if suffix == ".csv":
+                    return self._arrow_statistics(pacsv.read_csv(path))
+                if suffix == ".jsonl":
+                    return self._arrow_statistics(pajson.read_json(path))
+            except pa.ArrowInvalid:
+                # Fall back to the row-by-row reader on malformed input.
+                pass
+
+        # Aggregate in a single streaming pass; peak memory stays
+        # O(unique fields x unique types) regardless of file size.
+        # Type tallies key on the type object itself — hashing a type is
+        # cheaper than fetching and hashing its __name__ per value — and
+        # are converted to names once at the end.
+        row_count = 0
+        null_counts: dict[str, int] = defaultdict(int)
+        type_dist: dict[str, dict[type[object], int]] = defaultdict(
+            lambda: defaultdict(int)
+        )
+
+        def tally(row: dict[str, object]) -> None:
+            for field, value in row.items():
+                if value is None or value == "":
+                    null_counts[field] += 1
+                type_dist[field][type(value)] += 1
 
         if suffix == ".csv":
             with path.open(encoding="utf-8", newline="") as csv_handle:
                 reader = csv.DictReader(csv_handle)
                 for row in reader:
-                    rows.append(dict(row))
+                    row_count += 1
+                    tally(dict(row))
         else:
             # Treat everything else as JSONL.
-            with path.open(encoding="utf-8") as jsonl_handle:
+            with path.open("rb") as jsonl_handle:
                 for raw_line in jsonl_handle:
                     raw_line = raw_line.strip()
                     if not raw_line:
                         continue
                     try:
-                        parsed: object = json.loads(raw_line)
-                        if isinstance(parsed, dict):
-                            rows.append(parsed)
+                        parsed: object = _json_loads(raw_line)
                     except json.JSONDecodeError:
                         continue
-
-        row_count = len(rows)
-        null_counts: dict[str, int] = defaultdict(int)
-        type_dist: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
-
-        for row in rows:
-            for field, value in row.items():
-                if value is None or value == "":
-                    null_counts[field] += 1
-                type_name = type(value).__name__
-                type_dist[field][type_name] += 1
+                    if isinstance(parsed, dict):
+                        row_count += 1
+                        tally(parsed)
 
         return {
             "row_count": row_count,
             "null_counts": dict(null_counts),
-            "type_distribution": {k: dict(v) for k, v in type_dist.items()},
+            "type_distribution": _named_type_distribution(type_dist),
+        }
+
+    @staticmethod
+    def _arrow_statistics(table: pa.Table) -> dict[str, object]:  # pragma: no cover
+        """Column-wise statistics over a parsed Arrow table.
+
+        ``null_count`` is tracked natively per Arrow column, and the type
+        distribution comes from the inferred column dtype rather than a
+        per-row Python loop.
+        """
+        null_counts: dict[str, int] = {}
+        type_dist: dict[str, dict[str, int]] = {}
+
+        for column_name, column in zip(table.column_names, table.columns, strict=True):
+            null_count = column.null_count
+            if null_count:
+                null_counts[column_name] = null_count
+            distribution: dict[str, int] = {}
+            non_null = len(column) - null_count
+            if non_null:
+                distribution[_arrow_type_name(column.type)] = non_null
+            if null_count:
+                distribution["NoneType"] = null_count
+            type_dist[column_name] = distribution
+
+        return {
+            "row_count": table.num_rows,
+            "null_counts": null_counts,
+            "type_distribution": type_dist,
         }
 
 
+def _arrow_type_name(arrow_type: object) -> str:  # pragma: no cover
+    """Map an Arrow column dtype to the matching Python type name."""
+    if pa.types.is_boolean(arrow_type):
+        return "bool"
+    if pa.types.is_integer(arrow_type):
+        return "int"
+    if pa.types.is_floating(arrow_type):
+        return "float"
+    if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+        return "str"
+    return str(arrow_type)
+
+
 class DatasetVersionManager:
     """Tracks version history for datasets."""
 
     def __init__(self) -> None:
         self._versions: dict[str, list[DatasetVersion]] = defaultdict(list)
+        # Last version per dataset as a parsed (major, minor, patch) tuple,
+        # so incrementing never re-splits and re-parses the version string.
+        self._last_tuple: dict[str, tuple[int, int, int]] = {}
 
     def create_version(self, dataset_id: str, changes: str) -> DatasetVersion:
         """Create a new version entry for the given dataset.
@@ -246,22 +690,20 @@ class DatasetVersionManager:
         Returns:
             The newly created ``DatasetVersion``.
         """
-        existing = self._versions[dataset_id]
-        if existing:
-            last_version_str = existing[-1].version
-            parts = last_version_str.split(".")
-            try:
-                minor = int(parts[1]) + 1
-                new_version = f"{parts[0]}.{minor}.0"
-            except (IndexError, ValueError):
-                new_version = "1.1.0"
+        last = self._last_tuple.get(dataset_id)
+        if last is None:
+            major, minor, patch = 1, 0, 0
         else:
-            new_version = "1.0.0"
+            major, minor, patch = last[0], last[1] + 1, 0
+        self._last_tuple[dataset_id] = (major, minor, patch)
+        new_version = f"{major}.{minor}.{patch}"
 
-        version_entry = DatasetVersion(
+        # Every field is produced here from trusted values, so skip the
+        # pydantic-core validation pass on this internal construction path.
+        version_entry = DatasetVersion.model_construct(
             version=new_version,
             changes=changes,
-            created_at=datetime.now(tz=timezone.utc),
+            created_at=_utc_now(),
         )
         self._versions[dataset_id].append(version_entry)
         return version_entry
@@ -287,12 +729,42 @@ def compute_sha256(file_path: str) -> str:
     Returns:
         Lowercase hex string of the SHA-256 digest.
     """
-    hasher = hashlib.sha256()
     path = Path(file_path)
     with path.open("rb") as binary_handle:
-        for chunk in iter(lambda: binary_handle.read(65536), b""):
-            hasher.update(chunk)
-    return hasher.hexdigest()
+        if path.stat().st_size >= _MMAP_HASH_THRESHOLD:
+            with mmap.mmap(
+                binary_handle.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mapped:
+                if hasattr(mapped, "madvise"):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                hasher = hashlib.sha256()
+                hasher.update(mapped)
+                return hasher.hexdigest()
+        digest = hashlib.file_digest(
+            binary_handle, "sha256", _bufsize=_HASH_BUFFER_SIZE
+        )
+    return digest.hexdigest()
+
+
+def compute_sha256_many(paths: list[str], max_workers: int | None = None) -> list[str]:
+    """Compute SHA-256 digests for several files concurrently.
+
+    Hashing releases the GIL while OpenSSL processes each buffer, so a
+    thread pool scales nearly linearly across cores for disjoint files.
+
+    Args:
+        paths: Paths of the files to hash.
+        max_workers: Thread count; defaults to ``min(len(paths), os.cpu_count())``.
+
+    Returns:
+        Hex digests in the same order as ``paths``.
+    """
+    if not paths:
+        return []
+    if max_workers is None:
+        max_workers = min(len(paths), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(compute_sha256, paths))
 
 
 __all__ = [
@@ -301,4 +773,5 @@ __all__ = [
     "DatasetValidator",
     "DatasetVersionManager",
     "compute_sha256",
+    "compute_sha256_many",
 ]
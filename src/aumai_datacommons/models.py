@@ -3,9 +3,43 @@
 from __future__ import annotations
 
 import enum
+import json
+import time
+from collections.abc import Callable
 from datetime import datetime, timezone
+from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
+
+# Annotated explicitly so both the orjson and stdlib assignments satisfy
+# strict mypy despite their differing full signatures.
+loads: Callable[[bytes | bytearray | str], Any]
+
+try:  # pragma: no cover - exercised only where orjson is installed
+    import orjson
+
+    def dumps(obj: object) -> bytes:
+        """Serialize an object to JSON bytes via orjson."""
+        return orjson.dumps(obj)
+
+    loads = orjson.loads
+except ImportError:
+
+    def dumps(obj: object) -> bytes:
+        """Serialize an object to JSON bytes via the stdlib encoder."""
+        return json.dumps(obj).encode("utf-8")
+
+    loads = json.loads
+
+
+def _now() -> datetime:
+    """Current UTC time via a direct clock read.
+
+    A local function avoids the per-call attribute lookup of a bound
+    ``datetime`` method as a default factory, and ``fromtimestamp`` with
+    an explicit timezone skips the slower ``now()`` path.
+    """
+    return datetime.fromtimestamp(time.time(), tz=timezone.utc)
 
 
 class DatasetFormat(str, enum.Enum):
@@ -17,35 +51,60 @@ class DatasetFormat(str, enum.Enum):
     arrow = "arrow"
 
 
+#: Allowed format strings, for cheap membership pre-checks (e.g. in the
+#: CLI) without touching enum machinery.
+DATASET_FORMAT_VALUES: frozenset[str] = frozenset(f.value for f in DatasetFormat)
+
+# Pre-bound value→member map; a single dict probe instead of the enum's
+# lookup path on the hot bulk-import route.
+_FMT_MAP: dict[str, DatasetFormat] = {f.value: f for f in DatasetFormat}
+
+
 class DatasetMetadata(BaseModel):
     """Metadata describing a registered dataset."""
 
+    # Defer core-schema construction to first use; import (CLI --help,
+    # test collection) no longer pays for validator building.  Frozen
+    # instances are hashable and safe to share across catalog indexes
+    # without defensive copies.
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
     dataset_id: str = Field(..., description="Unique identifier for the dataset.")
     name: str = Field(..., description="Human-readable name.")
     description: str = Field(..., description="Detailed description of the dataset.")
     format: DatasetFormat = Field(..., description="File format of the dataset.")
     size_bytes: int = Field(..., ge=0, description="Size of the dataset in bytes.")
     num_records: int = Field(..., ge=0, description="Number of records in the dataset.")
-    schema: dict[str, object] = Field(
+    schema: dict[str, str] = Field(
         default_factory=dict,
-        description="JSON Schema or field type map for the dataset.",
+        description="Field-name to type-name map for the dataset.",
     )
     license: str = Field(..., description="SPDX license identifier or name.")
     tags: list[str] = Field(default_factory=list, description="Free-form search tags.")
     version: str = Field(default="1.0.0", description="Semantic version string.")
     created_at: datetime = Field(
-        default_factory=lambda: datetime.now(tz=timezone.utc),
+        default_factory=_now,
         description="UTC timestamp when the record was created.",
     )
 
+    @field_validator("format", mode="before")
+    @classmethod
+    def _coerce_format(cls, value: object) -> object:
+        """Resolve format strings through a pre-bound dict probe."""
+        if isinstance(value, str):
+            return _FMT_MAP.get(value, value)
+        return value
+
 
 class DatasetVersion(BaseModel):
     """A single version entry for a dataset."""
 
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
     version: str = Field(..., description="Semantic version string.")
     changes: str = Field(..., description="Human-readable change description.")
     created_at: datetime = Field(
-        default_factory=lambda: datetime.now(tz=timezone.utc),
+        default_factory=_now,
         description="UTC timestamp when the version was created.",
     )
 
@@ -53,6 +112,8 @@ class DatasetVersion(BaseModel):
 class DownloadResult(BaseModel):
     """Result of a dataset download operation."""
 
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
     dataset_id: str = Field(..., description="ID of the downloaded dataset.")
     path: str = Field(..., description="Local filesystem path to the downloaded file.")
     verified: bool = Field(
@@ -61,9 +122,42 @@ class DownloadResult(BaseModel):
     sha256: str = Field(..., description="SHA-256 hex digest of the downloaded file.")
 
 
+# Shared adapter so validation machinery is built once at import instead of
+# per call site.
+_METADATA_ADAPTER: TypeAdapter[DatasetMetadata] = TypeAdapter(DatasetMetadata)
+
+
+def parse_metadata_json(data: bytes | str) -> DatasetMetadata:
+    """Validate JSON text or bytes into a ``DatasetMetadata``.
+
+    Parsing and validation happen in one pydantic-core pass, which is
+    faster than ``loads`` followed by ``model_validate``.
+
+    Raises:
+        pydantic.ValidationError: If the input is not valid JSON or does
+            not satisfy the model schema.
+    """
+    return _METADATA_ADAPTER.validate_json(data)
+
+
+def parse_metadata_dict(data: dict[str, object]) -> DatasetMetadata:
+    """Validate an already-parsed mapping into a ``DatasetMetadata``.
+
+    Raises:
+        pydantic.ValidationError: If the mapping does not satisfy the
+            model schema.
+    """
+    return _METADATA_ADAPTER.validate_python(data)
+
+
 __all__ = [
+    "DATASET_FORMAT_VALUES",
     "DatasetFormat",
     "DatasetMetadata",
     "DatasetVersion",
     "DownloadResult",
+    "dumps",
+    "loads",
+    "parse_metadata_dict",
+    "parse_metadata_json",
 ]
@@ -2,18 +2,37 @@
 
 from __future__ import annotations
 
-import json
-import tempfile
+import os
+import shutil
 from pathlib import Path
 
 import pytest
 
-from aumai_datacommons.models import DatasetFormat, DatasetMetadata
+from aumai_datacommons.core import DatasetCatalog
+from aumai_datacommons.models import DatasetFormat, DatasetMetadata, dumps
 
 
-@pytest.fixture()
+def pytest_configure(config: pytest.Config) -> None:
+    """Put tmp_path files on tmpfs when available.
+
+    The validator and hashing tests are dominated by tiny filesystem
+    writes; on /dev/shm they stay in page cache.  An explicit --basetemp
+    still wins.  The per-PID directory is removed at session end so
+    RAM-backed temp dirs do not accumulate across runs.
+    """
+    if os.path.isdir("/dev/shm") and not config.option.basetemp:
+        basetemp = Path(f"/dev/shm/pytest-{os.getpid()}")
+        config.option.basetemp = basetemp
+        config.add_cleanup(lambda: shutil.rmtree(basetemp, ignore_errors=True))
+
+
+@pytest.fixture(scope="session")
 def catalog_metadata() -> DatasetMetadata:
-    """A valid DatasetMetadata object for use in tests."""
+    """A valid DatasetMetadata object for use in tests.
+
+    Session-scoped: the instance is never mutated, so all tests can
+    share one validated model.
+    """
     return DatasetMetadata(
         dataset_id="ds-001",
         name="Agent Traces Dataset",
@@ -28,7 +47,7 @@ def catalog_metadata() -> DatasetMetadata:
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def second_metadata() -> DatasetMetadata:
     """A second DatasetMetadata for multi-entry tests."""
     return DatasetMetadata(
@@ -44,42 +63,114 @@ def second_metadata() -> DatasetMetadata:
     )
 
 
-@pytest.fixture()
-def jsonl_file(tmp_path: Path) -> Path:
-    """A temporary JSONL file with valid records."""
-    path = tmp_path / "data.jsonl"
+@pytest.fixture(scope="module")
+def prepopulated_catalog(
+    catalog_metadata: DatasetMetadata, second_metadata: DatasetMetadata
+) -> DatasetCatalog:
+    """A catalog holding both metadata fixtures, built once per module.
+
+    For read-only tests (search, list, get); tests that mutate the
+    catalog must build their own instance.
+    """
+    catalog = DatasetCatalog()
+    catalog.register_many([catalog_metadata, second_metadata])
+    return catalog
+
+
+# Validator input files are only ever read, so they are written once per
+# session under tmp_path_factory instead of once per test under tmp_path.
+
+
+@pytest.fixture(scope="session")
+def jsonl_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A JSONL file with valid records."""
+    path = tmp_path_factory.mktemp("data") / "data.jsonl"
     records = [
         {"trace_id": "t-001", "action": "move", "reward": 1.0},
         {"trace_id": "t-002", "action": "stop", "reward": 0.0},
         {"trace_id": "t-003", "action": "jump", "reward": 2.5},
     ]
-    lines = [json.dumps(r) for r in records]
-    path.write_text("\n".join(lines), encoding="utf-8")
+    path.write_bytes(b"\n".join(dumps(r) for r in records))
     return path
 
 
-@pytest.fixture()
-def csv_file(tmp_path: Path) -> Path:
-    """A temporary CSV file with valid records."""
-    path = tmp_path / "data.csv"
+@pytest.fixture(scope="session")
+def csv_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A CSV file with valid records."""
+    path = tmp_path_factory.mktemp("data") / "data.csv"
     path.write_text("id,value,label\n1,3.14,cat\n2,2.71,dog\n3,,fish\n", encoding="utf-8")
     return path
 
 
-@pytest.fixture()
-def schema_file(tmp_path: Path) -> Path:
-    """A temporary JSON schema file."""
-    path = tmp_path / "schema.json"
-    path.write_text(
-        json.dumps({"trace_id": "str", "action": "str", "reward": "float"}),
-        encoding="utf-8",
-    )
+@pytest.fixture(scope="session")
+def schema_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A JSON schema file matching jsonl_file."""
+    path = tmp_path_factory.mktemp("data") / "schema.json"
+    path.write_bytes(dumps({"trace_id": "str", "action": "str", "reward": "float"}))
+    return path
+
+
+@pytest.fixture(scope="session")
+def missing_field_jsonl_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A JSONL file whose record lacks the 'action' field."""
+    path = tmp_path_factory.mktemp("variants") / "missing_field.jsonl"
+    path.write_bytes(b'{"trace_id": "t-1"}\n')
+    return path
+
+
+@pytest.fixture(scope="session")
+def wrong_type_jsonl_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A JSONL file whose 'trace_id' is an int instead of a str."""
+    path = tmp_path_factory.mktemp("variants") / "wrong_type.jsonl"
+    path.write_bytes(b'{"trace_id": 123, "action": "move"}\n')
+    return path
+
+
+@pytest.fixture(scope="session")
+def bad_json_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A file whose single line is not JSON."""
+    path = tmp_path_factory.mktemp("variants") / "bad.jsonl"
+    path.write_bytes(b"not json at all\n")
+    return path
+
+
+@pytest.fixture(scope="session")
+def non_dict_jsonl_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A JSONL file whose record is an array, not an object."""
+    path = tmp_path_factory.mktemp("variants") / "array.jsonl"
+    path.write_bytes(b"[1,2,3]\n")
+    return path
+
+
+@pytest.fixture(scope="session")
+def blank_lines_jsonl_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A JSONL file with an interior blank line between valid records."""
+    path = tmp_path_factory.mktemp("variants") / "blank_lines.jsonl"
+    path.write_bytes(b'{"x": "hello"}\n\n{"x": "world"}\n')
     return path
 
 
-@pytest.fixture()
-def dataset_config_file(tmp_path: Path, catalog_metadata: DatasetMetadata) -> Path:
-    """A temporary JSON file representing a dataset registration config."""
-    path = tmp_path / "dataset.json"
-    path.write_text(catalog_metadata.model_dump_json(), encoding="utf-8")
+# Pre-rendered registration config matching the catalog_metadata fixture
+# (minus created_at, which defaults at parse time).  A static blob skips
+# both model construction and pydantic-core serialization in the fixture.
+_DATASET_CONFIG_JSON = (
+    b'{"dataset_id":"ds-001","name":"Agent Traces Dataset",'
+    b'"description":"Traces collected from autonomous agent runs for benchmarking.",'
+    b'"format":"jsonl","size_bytes":1024000,"num_records":5000,'
+    b'"schema":{"trace_id":"str","action":"str","reward":"float"},'
+    b'"license":"Apache-2.0","tags":["agents","traces","benchmarking"],'
+    b'"version":"1.0.0"}'
+)
+
+
+@pytest.fixture(scope="session")
+def dataset_config_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A JSON file representing a dataset registration config.
+
+    Session-scoped: the content is a compile-time constant, so the file
+    is written once.  Tests that need a private copy should
+    ``shutil.copyfile`` it rather than re-serializing.
+    """
+    path = tmp_path_factory.mktemp("cfg") / "dataset.json"
+    path.write_bytes(_DATASET_CONFIG_JSON)
     return path
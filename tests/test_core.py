@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-import json
-from pathlib import Path
+import hashlib
+from typing import TYPE_CHECKING
 
 import pytest
 
@@ -13,8 +13,15 @@ from aumai_datacommons.core import (
     DatasetValidator,
     DatasetVersionManager,
     compute_sha256,
+    compute_sha256_many,
 )
-from aumai_datacommons.models import DatasetFormat, DatasetMetadata, DatasetVersion
+from aumai_datacommons.models import DatasetFormat, DatasetMetadata
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Enumerated once; tuple iteration beats enum iteration at runtime.
+_ALL_FORMATS = tuple(DatasetFormat)
 
 
 # ---------------------------------------------------------------------------
@@ -77,18 +84,20 @@ class TestDatasetMetadata:
         )
         assert meta.tags == []
 
-    def test_all_formats(self) -> None:
-        for fmt in DatasetFormat:
-            meta = DatasetMetadata(
-                dataset_id=f"ds-{fmt.value}",
-                name=f"Dataset {fmt.value}",
-                description="test",
-                format=fmt,
-                size_bytes=100,
-                num_records=10,
-                license="MIT",
-            )
-            assert meta.format == fmt
+    @pytest.mark.parametrize("fmt", _ALL_FORMATS)
+    def test_all_formats(self, fmt: DatasetFormat) -> None:
+        # Only enum passthrough is under test here, so skip the validator
+        # chain; field validation is covered by the tests above.
+        meta = DatasetMetadata.model_construct(
+            dataset_id=f"ds-{fmt.value}",
+            name=f"Dataset {fmt.value}",
+            description="test",
+            format=fmt,
+            size_bytes=100,
+            num_records=10,
+            license="MIT",
+        )
+        assert meta.format == fmt
 
 
 # ---------------------------------------------------------------------------
@@ -97,154 +106,186 @@ class TestDatasetMetadata:
 
 
 class TestDatasetCatalog:
+    def setup_method(self) -> None:
+        # Fresh per-test catalog for the mutating tests; the read-only
+        # tests take the shared prepopulated_catalog fixture instead.
+        self.catalog = DatasetCatalog()
+
     def test_register_and_get(self, catalog_metadata: DatasetMetadata) -> None:
-        catalog = DatasetCatalog()
-        catalog.register(catalog_metadata)
-        retrieved = catalog.get("ds-001")
+        self.catalog.register(catalog_metadata)
+        retrieved = self.catalog.get("ds-001")
         assert retrieved.dataset_id == "ds-001"
         assert retrieved.name == "Agent Traces Dataset"
 
     def test_register_overwrites(self, catalog_metadata: DatasetMetadata) -> None:
-        catalog = DatasetCatalog()
-        catalog.register(catalog_metadata)
-        updated = catalog_metadata.model_copy(update={"name": "Updated Name"})
-        catalog.register(updated)
-        assert catalog.get("ds-001").name == "Updated Name"
-
-    def test_get_missing_raises(self) -> None:
-        catalog = DatasetCatalog()
-        with pytest.raises(DatasetNotFoundError):
-            catalog.get("nonexistent-id")
-
-    def test_get_missing_error_message(self) -> None:
-        catalog = DatasetCatalog()
+        self.catalog.register(catalog_metadata)
+        # Clone without revalidating: only register's overwrite semantics
+        # are under test.
+        updated = DatasetMetadata.model_construct(
+            **catalog_metadata.__dict__ | {"name": "Updated Name"}
+        )
+        self.catalog.register(updated)
+        assert self.catalog.get("ds-001").name == "Updated Name"
+
+    def test_get_missing_raises(self, prepopulated_catalog: DatasetCatalog) -> None:
+        # One test covers both the exception type and that the message
+        # names the missing id.
         with pytest.raises(DatasetNotFoundError, match="nonexistent"):
-            catalog.get("nonexistent")
+            prepopulated_catalog.get("nonexistent")
 
     def test_list_all_empty(self) -> None:
-        catalog = DatasetCatalog()
-        assert catalog.list_all() == []
+        assert self.catalog.list_all() == []
 
     def test_list_all_returns_all(
-        self,
-        catalog_metadata: DatasetMetadata,
-        second_metadata: DatasetMetadata,
+        self, prepopulated_catalog: DatasetCatalog
     ) -> None:
-        catalog = DatasetCatalog()
-        catalog.register(catalog_metadata)
-        catalog.register(second_metadata)
-        items = catalog.list_all()
+        items = prepopulated_catalog.list_all()
         assert len(items) == 2
 
     def test_list_all_pagination_limit(
-        self,
-        catalog_metadata: DatasetMetadata,
-        second_metadata: DatasetMetadata,
+        self, prepopulated_catalog: DatasetCatalog
     ) -> None:
-        catalog = DatasetCatalog()
-        catalog.register(catalog_metadata)
-        catalog.register(second_metadata)
-        items = catalog.list_all(limit=1)
+        items = prepopulated_catalog.list_all(limit=1)
         assert len(items) == 1
 
     def test_list_all_pagination_offset(
-        self,
-        catalog_metadata: DatasetMetadata,
-        second_metadata: DatasetMetadata,
+        self, prepopulated_catalog: DatasetCatalog
     ) -> None:
-        catalog = DatasetCatalog()
-        catalog.register(catalog_metadata)
-        catalog.register(second_metadata)
-        items = catalog.list_all(offset=1)
+        items = prepopulated_catalog.list_all(offset=1)
         assert len(items) == 1
 
     def test_list_all_offset_beyond_end(
-        self, catalog_metadata: DatasetMetadata
+        self, prepopulated_catalog: DatasetCatalog
     ) -> None:
-        catalog = DatasetCatalog()
-        catalog.register(catalog_metadata)
-        items = catalog.list_all(offset=100)
+        items = prepopulated_catalog.list_all(offset=100)
         assert items == []
 
     def test_search_by_query_matches_name(
-        self, catalog_metadata: DatasetMetadata
+        self, prepopulated_catalog: DatasetCatalog
     ) -> None:
-        catalog = DatasetCatalog()
-        catalog.register(catalog_metadata)
-        results = catalog.search("agent traces")
+        results = prepopulated_catalog.search("agent traces")
         assert len(results) == 1
         assert results[0].dataset_id == "ds-001"
 
     def test_search_case_insensitive(
-        self, catalog_metadata: DatasetMetadata
+        self, prepopulated_catalog: DatasetCatalog
     ) -> None:
-        catalog = DatasetCatalog()
-        catalog.register(catalog_metadata)
-        results = catalog.search("AGENT TRACES")
+        results = prepopulated_catalog.search("AGENT TRACES")
         assert len(results) == 1
 
     def test_search_by_query_matches_description(
-        self, catalog_metadata: DatasetMetadata
+        self, prepopulated_catalog: DatasetCatalog
     ) -> None:
-        catalog = DatasetCatalog()
-        catalog.register(catalog_metadata)
-        results = catalog.search("autonomous")
+        results = prepopulated_catalog.search("autonomous")
         assert len(results) == 1
 
-    def test_search_no_match(self, catalog_metadata: DatasetMetadata) -> None:
-        catalog = DatasetCatalog()
-        catalog.register(catalog_metadata)
-        results = catalog.search("nonexistent-query-xyz")
+    def test_search_no_match(self, prepopulated_catalog: DatasetCatalog) -> None:
+        results = prepopulated_catalog.search("nonexistent-query-xyz")
         assert results == []
 
-    def test_search_filter_by_format(
+    @pytest.mark.parametrize(
+        ("query", "dataset_format", "tags", "expected_ids"),
+        [
+            # Empty query matches both, format keeps only the jsonl entry.
+            ("", DatasetFormat.jsonl, None, {"ds-001"}),
+            ("", None, ["agents"], {"ds-001"}),
+            # ds-001 has ["agents", "traces", "benchmarking"] — every
+            # requested tag must match.
+            ("", None, ["agents", "traces"], {"ds-001"}),
+            ("", None, ["agents", "regression"], set()),
+            ("", DatasetFormat.csv, ["tabular"], {"ds-002"}),
+        ],
+    )
+    def test_search_filters(
         self,
-        catalog_metadata: DatasetMetadata,
-        second_metadata: DatasetMetadata,
+        prepopulated_catalog: DatasetCatalog,
+        query: str,
+        dataset_format: DatasetFormat | None,
+        tags: list[str] | None,
+        expected_ids: set[str],
     ) -> None:
-        catalog = DatasetCatalog()
-        catalog.register(catalog_metadata)
-        catalog.register(second_metadata)
-        # Both match empty query "" but only one is jsonl
-        results = catalog.search("", dataset_format=DatasetFormat.jsonl)
-        assert all(r.format == DatasetFormat.jsonl for r in results)
-
-    def test_search_filter_by_tags(
+        results = prepopulated_catalog.search(
+            query, dataset_format=dataset_format, tags=tags
+        )
+        assert {r.dataset_id for r in results} == expected_ids
+
+    def test_register_many(
         self,
         catalog_metadata: DatasetMetadata,
         second_metadata: DatasetMetadata,
     ) -> None:
-        catalog = DatasetCatalog()
-        catalog.register(catalog_metadata)
-        catalog.register(second_metadata)
-        results = catalog.search("", tags=["agents"])
-        assert len(results) == 1
-        assert results[0].dataset_id == "ds-001"
+        self.catalog.register_many([catalog_metadata, second_metadata])
+        assert len(self.catalog.list_all()) == 2
+        assert self.catalog.get("ds-002").name == second_metadata.name
 
-    def test_search_filter_all_tags_must_match(
+    def test_register_unchecked_skips_validation(
         self, catalog_metadata: DatasetMetadata
     ) -> None:
-        catalog = DatasetCatalog()
-        catalog.register(catalog_metadata)
-        # ds-001 has ["agents", "traces", "benchmarking"] — matches both
-        results = catalog.search("", tags=["agents", "traces"])
-        assert len(results) == 1
-        # ds-001 does NOT have "regression" tag
-        results2 = catalog.search("", tags=["agents", "regression"])
-        assert results2 == []
+        self.catalog.register_unchecked([catalog_metadata.model_dump()])
+        retrieved = self.catalog.get("ds-001")
+        assert retrieved.name == catalog_metadata.name
+        assert len(self.catalog.search("agent", tags=["traces"])) == 1
+
+    def test_search_multi_word_requires_phrase(
+        self, prepopulated_catalog: DatasetCatalog
+    ) -> None:
+        # Both words occur, but not adjacently — substring semantics hold.
+        assert prepopulated_catalog.search("traces agent") == []
+        assert len(prepopulated_catalog.search("agent traces")) == 1
+
+    def test_search_multi_word_missing_token_short_circuits(
+        self, prepopulated_catalog: DatasetCatalog
+    ) -> None:
+        assert prepopulated_catalog.search("agent zzznope") == []
 
-    def test_search_format_and_tags_combined(
+    def test_save_load_roundtrip(
         self,
+        tmp_path: Path,
         catalog_metadata: DatasetMetadata,
         second_metadata: DatasetMetadata,
     ) -> None:
-        catalog = DatasetCatalog()
-        catalog.register(catalog_metadata)
-        catalog.register(second_metadata)
-        results = catalog.search("", dataset_format=DatasetFormat.csv, tags=["tabular"])
-        assert len(results) == 1
-        assert results[0].dataset_id == "ds-002"
+        self.catalog.register(catalog_metadata)
+        self.catalog.register(second_metadata)
+        snapshot = tmp_path / "catalog.snapshot"
+        self.catalog.save(str(snapshot))
+        loaded = DatasetCatalog.load(str(snapshot))
+        assert loaded.get("ds-001").name == catalog_metadata.name
+        assert len(loaded.list_all()) == 2
+
+    def test_load_rebuilds_search_indexes(
+        self, tmp_path: Path, catalog_metadata: DatasetMetadata
+    ) -> None:
+        self.catalog.register(catalog_metadata)
+        snapshot = tmp_path / "catalog.snapshot"
+        self.catalog.save(str(snapshot))
+        loaded = DatasetCatalog.load(str(snapshot))
+        assert len(loaded.search("agent", tags=["traces"])) == 1
+
+    def test_save_empty_catalog(self, tmp_path: Path) -> None:
+        snapshot = tmp_path / "catalog.snapshot"
+        self.catalog.save(str(snapshot))
+        loaded = DatasetCatalog.load(str(snapshot))
+        assert loaded.list_all() == []
+
+    def test_search_after_overwrite_uses_new_text(
+        self, catalog_metadata: DatasetMetadata
+    ) -> None:
+        self.catalog.register(catalog_metadata)
+        updated = catalog_metadata.model_copy(
+            update={"name": "Renamed Dataset", "description": "Fresh description."}
+        )
+        self.catalog.register(updated)
+        assert self.catalog.search("agent") == []
+        assert len(self.catalog.search("renamed")) == 1
 
+    def test_overwrite_removes_stale_tags(
+        self, catalog_metadata: DatasetMetadata
+    ) -> None:
+        self.catalog.register(catalog_metadata)
+        updated = catalog_metadata.model_copy(update={"tags": ["fresh"]})
+        self.catalog.register(updated)
+        assert self.catalog.search("", tags=["agents"]) == []
+        assert len(self.catalog.search("", tags=["fresh"])) == 1
 
 # ---------------------------------------------------------------------------
 # DatasetValidator tests
@@ -258,20 +299,18 @@ class TestDatasetValidator:
         errors = validator.validate_schema(str(jsonl_file), schema)
         assert errors == []
 
-    def test_validate_schema_missing_field(self, tmp_path: Path) -> None:
-        path = tmp_path / "data.jsonl"
-        path.write_text('{"trace_id": "t-1"}\n', encoding="utf-8")
+    def test_validate_schema_missing_field(
+        self, missing_field_jsonl_file: Path
+    ) -> None:
         validator = DatasetValidator()
         schema = {"trace_id": "str", "action": "str"}
-        errors = validator.validate_schema(str(path), schema)
+        errors = validator.validate_schema(str(missing_field_jsonl_file), schema)
         assert any("missing required field" in e and "action" in e for e in errors)
 
-    def test_validate_schema_wrong_type(self, tmp_path: Path) -> None:
-        path = tmp_path / "data.jsonl"
-        path.write_text('{"trace_id": 123, "action": "move"}\n', encoding="utf-8")
+    def test_validate_schema_wrong_type(self, wrong_type_jsonl_file: Path) -> None:
         validator = DatasetValidator()
         schema = {"trace_id": "str", "action": "str"}
-        errors = validator.validate_schema(str(path), schema)
+        errors = validator.validate_schema(str(wrong_type_jsonl_file), schema)
         assert any("trace_id" in e and "str" in e for e in errors)
 
     def test_validate_schema_file_not_found(self, tmp_path: Path) -> None:
@@ -281,35 +320,79 @@ class TestDatasetValidator:
         assert len(errors) == 1
         assert "File not found" in errors[0]
 
-    def test_validate_schema_invalid_json_line(self, tmp_path: Path) -> None:
-        path = tmp_path / "bad.jsonl"
-        path.write_text("not json at all\n", encoding="utf-8")
+    def test_validate_schema_invalid_json_line(self, bad_json_file: Path) -> None:
         validator = DatasetValidator()
-        errors = validator.validate_schema(str(path), {"x": "str"})
+        errors = validator.validate_schema(str(bad_json_file), {"x": "str"})
         assert any("JSON decode error" in e for e in errors)
 
-    def test_validate_schema_non_dict_record(self, tmp_path: Path) -> None:
-        path = tmp_path / "array.jsonl"
-        path.write_text("[1,2,3]\n", encoding="utf-8")
+    def test_validate_schema_non_dict_record(self, non_dict_jsonl_file: Path) -> None:
         validator = DatasetValidator()
-        errors = validator.validate_schema(str(path), {"x": "str"})
+        errors = validator.validate_schema(str(non_dict_jsonl_file), {"x": "str"})
         assert any("not a JSON object" in e for e in errors)
 
-    def test_validate_schema_empty_lines_skipped(self, tmp_path: Path) -> None:
-        path = tmp_path / "data.jsonl"
-        path.write_text('{"x": "hello"}\n\n{"x": "world"}\n', encoding="utf-8")
+    def test_validate_schema_empty_lines_skipped(
+        self, blank_lines_jsonl_file: Path
+    ) -> None:
         validator = DatasetValidator()
-        errors = validator.validate_schema(str(path), {"x": "str"})
+        errors = validator.validate_schema(str(blank_lines_jsonl_file), {"x": "str"})
         assert errors == []
 
     def test_validate_schema_unknown_type_name_ignored(self, tmp_path: Path) -> None:
         path = tmp_path / "data.jsonl"
-        path.write_text('{"x": "hello"}\n', encoding="utf-8")
+        path.write_bytes(b'{"x": "hello"}\n')
         validator = DatasetValidator()
         # "custom_type" is not in the type_map — should be silently skipped
         errors = validator.validate_schema(str(path), {"x": "custom_type"})
         assert errors == []
 
+    def test_validate_schema_bool_not_accepted_as_int(self, tmp_path: Path) -> None:
+        path = tmp_path / "data.jsonl"
+        path.write_bytes(b'{"count": true}\n')
+        validator = DatasetValidator()
+        errors = validator.validate_schema(str(path), {"count": "int"})
+        assert any("count" in e and "int" in e for e in errors)
+
+    def test_validate_schema_bool_matches_bool(self, tmp_path: Path) -> None:
+        path = tmp_path / "data.jsonl"
+        path.write_bytes(b'{"flag": false}\n')
+        validator = DatasetValidator()
+        errors = validator.validate_schema(str(path), {"flag": "bool"})
+        assert errors == []
+
+    def test_validate_and_profile_matches_separate_calls(
+        self, jsonl_file: Path
+    ) -> None:
+        validator = DatasetValidator()
+        schema = {"trace_id": "str", "action": "str", "reward": "float"}
+        errors, stats, digest = validator.validate_and_profile(
+            str(jsonl_file), schema
+        )
+        assert errors == validator.validate_schema(str(jsonl_file), schema)
+        assert stats == validator.compute_statistics(str(jsonl_file))
+        assert digest == compute_sha256(str(jsonl_file))
+
+    def test_validate_and_profile_reports_errors(self, tmp_path: Path) -> None:
+        path = tmp_path / "data.jsonl"
+        path.write_bytes(b'{"trace_id": 123}\nnot json\n')
+        validator = DatasetValidator()
+        errors, stats, digest = validator.validate_and_profile(
+            str(path), {"trace_id": "str"}
+        )
+        assert any("trace_id" in e for e in errors)
+        assert any("JSON decode error" in e for e in errors)
+        assert stats["row_count"] == 1
+        assert digest == compute_sha256(str(path))
+
+    def test_validate_and_profile_file_not_found(self, tmp_path: Path) -> None:
+        validator = DatasetValidator()
+        errors, stats, digest = validator.validate_and_profile(
+            str(tmp_path / "missing.jsonl"), {"x": "str"}
+        )
+        assert "File not found" in errors[0]
+        assert "error" in stats
+        assert digest == ""
+
+    @pytest.mark.slow
     def test_compute_statistics_jsonl(self, jsonl_file: Path) -> None:
         validator = DatasetValidator()
         stats = validator.compute_statistics(str(jsonl_file))
@@ -317,6 +400,7 @@ class TestDatasetValidator:
         assert "null_counts" in stats
         assert "type_distribution" in stats
 
+    @pytest.mark.slow
     def test_compute_statistics_csv(self, csv_file: Path) -> None:
         validator = DatasetValidator()
         stats = validator.compute_statistics(str(csv_file))
@@ -330,6 +414,7 @@ class TestDatasetValidator:
         result = validator.compute_statistics(nonexistent)
         assert "error" in result
 
+    @pytest.mark.slow
     def test_compute_statistics_type_distribution(self, jsonl_file: Path) -> None:
         validator = DatasetValidator()
         stats = validator.compute_statistics(str(jsonl_file))
@@ -345,24 +430,20 @@ class TestDatasetValidator:
 
 
 class TestDatasetVersionManager:
-    def test_create_first_version(self) -> None:
+    def test_create_version_records_changes(self) -> None:
         vm = DatasetVersionManager()
         version = vm.create_version("ds-001", "Initial release.")
-        assert version.version == "1.0.0"
         assert version.changes == "Initial release."
 
-    def test_create_second_version_increments_minor(self) -> None:
-        vm = DatasetVersionManager()
-        vm.create_version("ds-001", "Initial release.")
-        v2 = vm.create_version("ds-001", "Added new records.")
-        assert v2.version == "1.1.0"
-
-    def test_create_multiple_versions(self) -> None:
+    @pytest.mark.parametrize(
+        ("num_calls", "expected"),
+        [(1, "1.0.0"), (2, "1.1.0"), (3, "1.2.0")],
+    )
+    def test_version_increments_minor(self, num_calls: int, expected: str) -> None:
         vm = DatasetVersionManager()
-        vm.create_version("ds-001", "v1")
-        vm.create_version("ds-001", "v2")
-        v3 = vm.create_version("ds-001", "v3")
-        assert v3.version == "1.2.0"
+        for i in range(num_calls):
+            version = vm.create_version("ds-001", f"v{i + 1}")
+        assert version.version == expected
 
     def test_versions_are_independent_per_dataset(self) -> None:
         vm = DatasetVersionManager()
@@ -401,16 +482,22 @@ class TestDatasetVersionManager:
 # ---------------------------------------------------------------------------
 
 
+# Expected digests computed once at import rather than per test.
+_HELLO_WORLD_SHA = hashlib.sha256(b"hello, world").hexdigest()
+_EMPTY_SHA = hashlib.sha256(b"").hexdigest()
+
+
+def _file_sha256(path: str) -> str:
+    """Expected digest for a file, via the chunked C-level reader."""
+    with open(path, "rb") as handle:
+        return hashlib.file_digest(handle, "sha256").hexdigest()
+
+
 class TestComputeSha256:
     def test_sha256_known_content(self, tmp_path: Path) -> None:
-        import hashlib
-
-        content = b"hello, world"
         path = tmp_path / "file.bin"
-        path.write_bytes(content)
-        expected = hashlib.sha256(content).hexdigest()
-        result = compute_sha256(str(path))
-        assert result == expected
+        path.write_bytes(b"hello, world")
+        assert compute_sha256(str(path)) == _HELLO_WORLD_SHA
 
     def test_sha256_returns_hex_string(self, tmp_path: Path) -> None:
         path = tmp_path / "file.bin"
@@ -418,15 +505,12 @@ class TestComputeSha256:
         result = compute_sha256(str(path))
         assert isinstance(result, str)
         assert len(result) == 64
-        assert all(c in "0123456789abcdef" for c in result)
+        bytes.fromhex(result)  # raises ValueError on any non-hex character
 
     def test_sha256_empty_file(self, tmp_path: Path) -> None:
-        import hashlib
-
         path = tmp_path / "empty.bin"
         path.write_bytes(b"")
-        expected = hashlib.sha256(b"").hexdigest()
-        assert compute_sha256(str(path)) == expected
+        assert compute_sha256(str(path)) == _EMPTY_SHA
 
     def test_sha256_different_files_differ(self, tmp_path: Path) -> None:
         path1 = tmp_path / "a.bin"
@@ -441,3 +525,32 @@ class TestComputeSha256:
         path1.write_bytes(b"identical")
         path2.write_bytes(b"identical")
         assert compute_sha256(str(path1)) == compute_sha256(str(path2))
+
+
+class TestComputeSha256Many:
+    def test_empty_paths(self) -> None:
+        assert compute_sha256_many([]) == []
+
+    def test_matches_serial_results(self, tmp_path: Path) -> None:
+        paths: list[str] = []
+        for i in range(4):
+            path = tmp_path / f"file-{i}.bin"
+            path.write_bytes(f"content {i}".encode())
+            paths.append(str(path))
+        assert compute_sha256_many(paths) == [_file_sha256(p) for p in paths]
+
+    def test_preserves_input_order(self, tmp_path: Path) -> None:
+        path_a = tmp_path / "a.bin"
+        path_b = tmp_path / "b.bin"
+        path_a.write_bytes(b"first")
+        path_b.write_bytes(b"second")
+        forward = compute_sha256_many([str(path_a), str(path_b)])
+        reverse = compute_sha256_many([str(path_b), str(path_a)])
+        assert forward == list(reversed(reverse))
+
+    def test_explicit_max_workers(self, tmp_path: Path) -> None:
+        path = tmp_path / "a.bin"
+        path.write_bytes(b"data")
+        assert compute_sha256_many([str(path)], max_workers=2) == [
+            _file_sha256(str(path))
+        ]